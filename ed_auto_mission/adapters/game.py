@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import zlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import cv2
 import numpy as np
 from PIL import Image
 
@@ -24,6 +28,19 @@ logger = logging.getLogger(__name__)
 
 WING_ICON_PATH = Path(__file__).parent.parent.parent / "wingicon.png"
 
+# Number of wing icon captures remembered by pixel hash
+WING_CACHE_SIZE = 256
+
+
+def _mse(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Squared error per pixel between two equally shaped uint8 images.
+
+    Channel errors are summed per pixel, which keeps the units of the
+    configured ED_*_MSE_THRESHOLD values.
+    """
+    return cv2.norm(a, b, cv2.NORM_L2SQR) / (a.shape[0] * a.shape[1])
+
 
 class EliteDangerousGame:
     """
@@ -50,16 +67,46 @@ class EliteDangerousGame:
 
         self._missions_seen = 0
         self._back_button_original: np.ndarray | None = None
+        self._back_button_crc: int | None = None
+        self._visible_texts: list[str] | None = None
+        self._wing_result: bool | None = None
 
         self._wing_icon: Image.Image | None = None
+        self._wing_cache: dict[tuple[int, int], np.ndarray] = {}
+        self._wing_seen: OrderedDict[bytes, bool] = OrderedDict()
         if WING_ICON_PATH.exists():
             self._wing_icon = Image.open(WING_ICON_PATH).convert("RGB")
         else:
             logger.warning("Wing icon not found at %s", WING_ICON_PATH)
 
+        self.refresh_regions()
+
+    def refresh_regions(self) -> None:
+        """Scale the UI map to the current screen size.
+
+        Regions are scaled once up front since the resolution is fixed for a
+        run; call this again after changing resolution.
+        """
+        self._regions = UI_MAP.scaled(self._screen.width, self._screen.height)
+        self._wing_seen.clear()
+
+        # Build the wing template for this resolution now so the first wing
+        # check doesn't pay for the resample.
+        if self._wing_icon is not None:
+            _, _, width, height = self._regions.wing_icon_regions[0]
+            self._wing_template((width, height))
+
+    def _row_index(self) -> int:
+        # Past the first screen the list scrolls and the selection stays on
+        # the last row position.
+        return min(self._missions_seen, len(self._regions.mission_regions) - 1)
+
     def reset_state(self) -> None:
         self._missions_seen = 0
         self._back_button_original = None
+        self._back_button_crc = None
+        self._visible_texts = None
+        self._wing_result = None
 
     def open_missions_board(self) -> None:
         self._input.press("space", presses=2, interval=slight_random_time(2))
@@ -72,62 +119,96 @@ class EliteDangerousGame:
         sleep(self._config.navigation_delay)
 
     def at_bottom(self) -> bool:
-        region = UI_MAP.back_button
-        scaled = region.scaled(self._screen.width, self._screen.height)
+        current = self._screen.capture_region_ndarray(self._regions.back_button)
 
-        current = np.array(self._screen.capture_region(scaled))
+        crc = zlib.crc32(current)
 
         if self._back_button_original is None:
             self._back_button_original = current
+            self._back_button_crc = crc
+            return False
+
+        # Byte-identical to the reference, so the MSE would be zero
+        if crc == self._back_button_crc:
             return False
 
-        mse = np.sum(
-            (self._back_button_original.astype("float") - current.astype("float")) ** 2
-        ) / float(self._back_button_original.shape[0] * current.shape[1])
+        mse = _mse(self._back_button_original, current)
 
         logger.debug("Back button MSE: %.2f", mse)
 
         return mse > self._config.back_button_mse_threshold
 
     def ocr_mission(self) -> str:
-        region = UI_MAP.get_mission_region(self._missions_seen)
-
+        index = self._row_index()
+        regions = self._regions.mission_regions
         filename = "ocr_debug.png" if self._debug_output else None
-        text = self._ocr.read_text(region, debug_filename=filename)
 
-        return text
+        # Rows on the first screen are read together on the first call and
+        # served from that batch; the last entry is the scrolled position.
+        if index < len(regions) - 1:
+            if self._visible_texts is None:
+                # The stacked rows form a single column of text; telling
+                # Tesseract so skips its multi-column layout analysis.
+                self._visible_texts = self._ocr.read_text_batch(
+                    regions[:-1],
+                    config=self._ocr.CONFIG_COLUMN,
+                    debug_filename=filename,
+                )
+            return self._visible_texts[index]
+
+        return self._ocr.read_text(regions[index], debug_filename=filename)
 
     def check_wing_mission(self) -> bool:
         if self._wing_icon is None:
             logger.warning("Wing icon reference not loaded, cannot check wing status")
             return False
 
-        region = UI_MAP.get_wing_icon_region(self._missions_seen)
-        scaled = region.scaled(self._screen.width, self._screen.height)
+        # Several wing rules can match the same row; compare it only once.
+        if self._wing_result is not None:
+            return self._wing_result
 
-        captured = self._screen.capture_region(scaled)
+        region = self._regions.wing_icon_regions[self._row_index()]
+        captured = self._screen.capture_region_ndarray(region)
 
         if self._debug_output:
-            captured.save("wing_debug.png")
+            self._screen.save_debug_image(captured, "wing_debug.png")
 
-        wing_resized = self._wing_icon.resize((captured.width, captured.height))
+        # The same card shows up again on every poll until the board refreshes
+        key = hashlib.blake2b(captured, digest_size=16).digest()
+        cached = self._wing_seen.get(key)
+        if cached is not None:
+            self._wing_seen.move_to_end(key)
+            self._wing_result = cached
+            return cached
 
-        captured_arr = np.array(captured).astype("float")
-        wing_arr = np.array(wing_resized).astype("float")
-
-        mse = np.sum((wing_arr - captured_arr) ** 2) / float(
-            wing_arr.shape[0] * wing_arr.shape[1]
-        )
+        height, width = captured.shape[:2]
+        mse = _mse(self._wing_template((width, height)), captured)
 
         logger.debug("Wing mission MSE: %.2f", mse)
 
-        return mse < self._config.wing_icon_mse_threshold
+        self._wing_result = mse < self._config.wing_icon_mse_threshold
+        self._wing_seen[key] = self._wing_result
+        if len(self._wing_seen) > WING_CACHE_SIZE:
+            self._wing_seen.popitem(last=False)
+        return self._wing_result
+
+    def _wing_template(self, size: tuple[int, int]) -> np.ndarray:
+        """Return the wing icon resized to ``size`` as a cached uint8 array."""
+        template = self._wing_cache.get(size)
+        if template is None:
+            template = np.array(self._wing_icon.resize(size), dtype=np.uint8)
+            self._wing_cache[size] = template
+        return template
 
     def accept_mission(self) -> None:
         self._input.press("space", presses=2, interval=slight_random_time(0.3))
+        # An accepted mission leaves the board and the rows below move up, so
+        # the batch read no longer lines up with the cursor.
+        self._visible_texts = None
 
     def next_mission(self) -> None:
         self._missions_seen += 1
+        self._wing_result = None
         self._input.press("s", interval=slight_random_time(0.2))
 
     def return_to_categories(self) -> None:
@@ -143,10 +224,10 @@ class EliteDangerousGame:
         self._input.press("1", presses=1, interval=slight_random_time(0.3))
         sleep(2)
 
-        region = UI_MAP.mission_count_region
-
         filename = "missions_accepted_debug.png" if self._debug_output else None
-        count = self._ocr.read_digits(region, debug_filename=filename)
+        count = self._ocr.read_digits(
+            self._regions.mission_count_region, debug_filename=filename
+        )
 
         self._input.press("1", presses=1, interval=slight_random_time(0.3))
 
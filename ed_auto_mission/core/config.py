@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 
 @dataclass
@@ -35,28 +36,20 @@ class AppConfig:
     wing_icon_mse_threshold: float = 5000.0
 
     @classmethod
-    def from_env(cls) -> AppConfig:
-        """Create configuration from environment variables with sensible defaults."""
-        return cls(
-            max_missions=int(os.getenv("ED_MAX_MISSIONS", "20")),
-            poll_interval_minutes=int(os.getenv("ED_POLL_INTERVAL", "10")),
-            poll_offset_minutes=int(os.getenv("ED_POLL_OFFSET", "5")),
-            loop_sleep_seconds=int(os.getenv("ED_LOOP_SLEEP", "20")),
-            dry_run=os.getenv("ED_DRY_RUN", "").lower() in ("1", "true", "yes"),
-            debug_ocr=os.getenv("ED_DEBUG_OCR", "").lower() in ("1", "true", "yes"),
-            interactive=os.getenv("ED_INTERACTIVE", "1").lower()
-            not in ("0", "false", "no"),
-            discord_webhook_url=os.getenv("DISCORD_WEBHOOK_URL"),
-            tesseract_path=os.getenv("TESSERACT_PATH"),
-            navigation_delay=float(os.getenv("ED_NAVIGATION_DELAY", "5.0")),
-            input_interval=float(os.getenv("ED_INPUT_INTERVAL", "0.3")),
-            back_button_mse_threshold=float(
-                os.getenv("ED_BACK_BUTTON_MSE_THRESHOLD", "1.0")
-            ),
-            wing_icon_mse_threshold=float(
-                os.getenv("ED_WING_ICON_MSE_THRESHOLD", "5000.0")
-            ),
-        )
+    def from_env(cls, refresh: bool = False) -> AppConfig:
+        """Create configuration from environment variables with sensible defaults.
+
+        The environment is parsed once per process; each call still returns a
+        fresh instance. Pass ``refresh=True`` to re-read it.
+        """
+        if refresh:
+            cls.reload_env()
+        return cls(**_parse_env())
+
+    @staticmethod
+    def reload_env() -> None:
+        """Discard the cached environment so the next from_env() re-reads it."""
+        _parse_env.cache_clear()
 
     def prompt_missing_values(self) -> None:
         """Interactively prompt for missing configuration values if interactive mode enabled."""
@@ -71,5 +64,31 @@ class AppConfig:
                 if webhook:
                     self.discord_webhook_url = webhook
                     os.environ["DISCORD_WEBHOOK_URL"] = webhook
+                    self.reload_env()
             except EOFError:
                 pass
+
+
+@lru_cache(maxsize=1)
+def _parse_env() -> dict[str, Any]:
+    """Parse AppConfig fields from environment variables."""
+    return dict(
+        max_missions=int(os.getenv("ED_MAX_MISSIONS", "20")),
+        poll_interval_minutes=int(os.getenv("ED_POLL_INTERVAL", "10")),
+        poll_offset_minutes=int(os.getenv("ED_POLL_OFFSET", "5")),
+        loop_sleep_seconds=int(os.getenv("ED_LOOP_SLEEP", "20")),
+        dry_run=os.getenv("ED_DRY_RUN", "").lower() in ("1", "true", "yes"),
+        debug_ocr=os.getenv("ED_DEBUG_OCR", "").lower() in ("1", "true", "yes"),
+        interactive=os.getenv("ED_INTERACTIVE", "1").lower()
+        not in ("0", "false", "no"),
+        discord_webhook_url=os.getenv("DISCORD_WEBHOOK_URL"),
+        tesseract_path=os.getenv("TESSERACT_PATH"),
+        navigation_delay=float(os.getenv("ED_NAVIGATION_DELAY", "5.0")),
+        input_interval=float(os.getenv("ED_INPUT_INTERVAL", "0.3")),
+        back_button_mse_threshold=float(
+            os.getenv("ED_BACK_BUTTON_MSE_THRESHOLD", "1.0")
+        ),
+        wing_icon_mse_threshold=float(
+            os.getenv("ED_WING_ICON_MSE_THRESHOLD", "5000.0")
+        ),
+    )
@@ -9,6 +9,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from ed_auto_mission.core.types import ScreenRegion
 
+Rect = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class ScaledUIMap:
+    """UIMap regions scaled to a concrete screen size, as (x, y, width, height)."""
+
+    back_button: Rect
+    mission_regions: tuple[Rect, ...]
+    wing_icon_regions: tuple[Rect, ...]
+    mission_count_region: Rect
+
 
 @dataclass(frozen=True)
 class UIMap:
@@ -44,6 +56,21 @@ class UIMap:
         x=499, y=630, width=140, height=80
     )
 
+    def scaled(self, screen_width: int, screen_height: int) -> ScaledUIMap:
+        """Scale every region to the given screen dimensions in one pass."""
+
+        def scale(regions: tuple[ScreenRegion, ...]) -> tuple[Rect, ...]:
+            return tuple(r.scaled(screen_width, screen_height) for r in regions)
+
+        return ScaledUIMap(
+            back_button=self.back_button.scaled(screen_width, screen_height),
+            mission_regions=scale(self.mission_regions),
+            wing_icon_regions=scale(self.wing_icon_regions),
+            mission_count_region=self.mission_count_region.scaled(
+                screen_width, screen_height
+            ),
+        )
+
     def get_mission_region(self, mission_index: int) -> ScreenRegion:
         """Get the screen region for a mission at the given index."""
         if mission_index < 6:
@@ -8,20 +8,95 @@ from typing import Iterable
 from ed_auto_mission.core.types import MissionRule
 
 
+class _NeedleMatcher:
+    """
+    Evaluates a fixed set of rules against OCR text in one pass.
+
+    Each distinct needle is searched for once, no matter how many rules or
+    groups share it, and the hits are recorded as a per-rule bitmask of
+    satisfied groups.
+    """
+
+    def __init__(self, rules: Iterable[MissionRule]):
+        self._rules = tuple(rules)
+        self._full_masks = tuple(
+            (1 << len(rule.needles_upper)) - 1 for rule in self._rules
+        )
+        self._needles: dict[str, list[tuple[int, int]]] = {}
+        for rule_idx, rule in enumerate(self._rules):
+            for group_idx, group in enumerate(rule.needles_upper):
+                for needle in group:
+                    self._needles.setdefault(needle, []).append(
+                        (rule_idx, group_idx)
+                    )
+
+    def match(self, upper_text: str) -> list[MissionRule]:
+        hits = [0] * len(self._rules)
+        for needle, owners in self._needles.items():
+            if needle in upper_text:
+                for rule_idx, group_idx in owners:
+                    hits[rule_idx] |= 1 << group_idx
+
+        return [
+            rule
+            for rule, hit, full in zip(self._rules, hits, self._full_masks)
+            if hit == full
+        ]
+
+
+class _Snapshot:
+    """
+    Immutable view of the registry contents, republished after every mutation.
+
+    Readers grab the current snapshot once and work from it without taking
+    the registry lock; the only state filled in afterwards is the per-category
+    matcher cache, where a racing duplicate build is harmless.
+    """
+
+    __slots__ = ("rules", "by_category", "categories", "by_label", "_matchers")
+
+    def __init__(self, rules: tuple[MissionRule, ...]):
+        by_category: dict[str, list[MissionRule]] = {}
+        by_label: dict[str, MissionRule] = {}
+        for rule in rules:
+            # remove() by label drops the first rule with that label
+            by_label.setdefault(rule.label, rule)
+            for category in dict.fromkeys(rule.categories):
+                by_category.setdefault(category, []).append(rule)
+
+        self.rules = rules
+        self.by_category = {
+            cat: tuple(cat_rules) for cat, cat_rules in by_category.items()
+        }
+        self.categories = tuple(self.by_category)
+        self.by_label = by_label
+        self._matchers: dict[str | None, _NeedleMatcher] = {}
+
+    def matcher(self, category: str | None) -> _NeedleMatcher:
+        matcher = self._matchers.get(category)
+        if matcher is None:
+            if category is None:
+                rules = self.rules
+            else:
+                rules = self.by_category.get(category, ())
+            matcher = _NeedleMatcher(rules)
+            self._matchers[category] = matcher
+        return matcher
+
+
 class MissionRegistry:
     """
     Thread-safe registry for mission detection rules.
 
     Designed so external controllers (CLI, future tooling) can mutate mission
-    preferences safely.
+    preferences safely. Mutations are serialised by a lock; reads use an
+    immutable snapshot and never block.
     """
 
     def __init__(self, missions: Iterable[MissionRule] | None = None):
-        self._missions: list[MissionRule] = []
+        self._missions: list[MissionRule] = list(missions) if missions else []
         self._lock = RLock()
-        if missions:
-            for mission in missions:
-                self._missions.append(mission)
+        self._snapshot = _Snapshot(tuple(self._missions))
 
     def add(
         self,
@@ -40,64 +115,96 @@ class MissionRegistry:
         )
         with self._lock:
             self._missions.append(rule)
+            self._publish()
         return rule
 
     def add_rule(self, rule: MissionRule) -> MissionRule:
         with self._lock:
             self._missions.append(rule)
+            self._publish()
         return rule
 
     def add_many(self, missions: Iterable[MissionRule]) -> list[MissionRule]:
-        added: list[MissionRule] = []
+        # Consume the iterable before taking the lock; a generator may be slow
+        added = list(missions)
         with self._lock:
-            for mission in missions:
-                self._missions.append(mission)
-                added.append(mission)
+            self._missions.extend(added)
+            self._publish()
         return added
 
-    def remove(self, mission: MissionRule | str) -> bool:
+    def replace_all(self, missions: Iterable[MissionRule]) -> list[MissionRule]:
+        """Swap in a new rule set; readers see either the old or the new set."""
+        rules = list(missions)
         with self._lock:
-            for idx, existing in enumerate(self._missions):
-                if existing == mission:
-                    self._missions.pop(idx)
-                    return True
+            self._missions[:] = rules
+            self._publish()
+        return rules
 
-                if isinstance(mission, str):
-                    if mission == existing.label:
-                        self._missions.pop(idx)
-                        return True
+    def remove(self, mission: MissionRule | str) -> bool:
+        with self._lock:
+            if isinstance(mission, str):
+                target = self._snapshot.by_label.get(mission)
+                if target is None:
+                    return False
+                idx = next(i for i, r in enumerate(self._missions) if r is target)
+            else:
+                try:
+                    idx = self._missions.index(mission)
+                except ValueError:
+                    return False
+
+            self._missions.pop(idx)
+            self._publish()
+            return True
+
+    def replace_at(self, index: int, rule: MissionRule) -> MissionRule:
+        with self._lock:
+            self._missions[index] = rule
+            self._publish()
+        return rule
 
-        return False
+    def swap(self, first: int, second: int) -> None:
+        with self._lock:
+            missions = self._missions
+            missions[first], missions[second] = missions[second], missions[first]
+            self._publish()
 
     def all(self) -> list[MissionRule]:
-        with self._lock:
-            return list(self._missions)
+        return list(self._snapshot.rules)
 
-    def get_unique_categories(self) -> list[str]:
-        seen: set[str] = set()
-        result: list[str] = []
-        with self._lock:
-            for mission in self._missions:
-                for category in mission.categories:
-                    if category not in seen:
-                        seen.add(category)
-                        result.append(category)
-        return result
-
-    def get_rules_for_category(self, category: str) -> list[MissionRule]:
-        with self._lock:
-            return [m for m in self._missions if category in m.categories]
+    def get_unique_categories(self) -> tuple[str, ...]:
+        return self._snapshot.categories
+
+    def get_rules_for_category(self, category: str) -> tuple[MissionRule, ...]:
+        return self._snapshot.by_category.get(category, ())
+
+    def match(self, text: str, category: str | None = None) -> list[MissionRule]:
+        """
+        Return the rules whose needle groups all appear in the OCR text.
+
+        Args:
+            text: OCR text of a mission
+            category: Only consider rules in this category (default: all rules)
+        """
+        return self._snapshot.matcher(category).match(text.upper())
 
     def clear(self) -> None:
         with self._lock:
             self._missions.clear()
+            self._publish()
+
+    def _publish(self) -> None:
+        """Publish a new snapshot of the rules. Caller must hold the lock."""
+        self._snapshot = _Snapshot(tuple(self._missions))
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._missions)
+        return len(self._snapshot.rules)
+
+    def __getitem__(self, index: int) -> MissionRule:
+        return self._snapshot.rules[index]
 
     def __iter__(self):
-        return iter(self.all())
+        return iter(self._snapshot.rules)
 
 
 # Default mission configurations for common mining commodities
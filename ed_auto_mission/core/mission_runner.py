@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from time import localtime, sleep
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from time import localtime, monotonic, strftime, time
 from typing import Callable, Optional
 
 from ed_auto_mission.core.types import GameInteraction, MissionRule, RunnerConfig
@@ -13,6 +16,37 @@ logger = logging.getLogger(__name__)
 
 DISCORD_LEVEL = logging.INFO + 5
 
+# Reward amount immediately before the "CR" suffix, e.g. "49,000,000 CR". The
+# word boundary keeps "20 crates" from reading as a reward, and the amount
+# must be on the same line as its suffix.
+_CREDIT_RE = re.compile(r"(\d[\d,]*)[ \t]*CR\b", re.IGNORECASE)
+
+
+def seconds_until_next_poll(
+    interval_minutes: int, offset_minutes: int, now: float | None = None
+) -> float:
+    """
+    Seconds from ``now`` until the next poll mark.
+
+    A poll mark is the start of any local minute where
+    ``(minute + offset_minutes) % interval_minutes == 0``. The result is always
+    positive, so a call made inside a mark minute targets the following mark.
+    """
+    if now is None:
+        now = time()
+    current = localtime(now)
+    elapsed = current.tm_sec + now % 1
+    # Walk the minute of the hour; an interval that doesn't divide 60 has
+    # marks that are not evenly spaced across the hour boundary
+    for minutes in range(61):
+        minute = (current.tm_min + minutes) % 60
+        if (minute + offset_minutes) % interval_minutes == 0:
+            delay = minutes * 60 - elapsed
+            if delay > 0:
+                return delay
+    # No minute of the hour is a mark; fall back to a plain interval
+    return interval_minutes * 60 - elapsed
+
 
 class MissionRunner:
     def __init__(
@@ -21,11 +55,23 @@ class MissionRunner:
         registry: MissionRegistry,
         config: RunnerConfig | None = None,
         should_stop: Callable[[], bool] | None = None,
+        stop_event: threading.Event | None = None,
     ):
         self.game = game_interaction
         self.registry = registry
         self.config = config or RunnerConfig()
-        self._should_stop = should_stop or (lambda: False)
+        self._stop_event = stop_event or threading.Event()
+        if should_stop is None:
+            self._should_stop = self._stop_event.is_set
+        else:
+            self._should_stop = lambda: self._stop_event.is_set() or should_stop()
+        # Refreshed per run so the per-mission debug calls can be skipped
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+        self._ocr_pool: ThreadPoolExecutor | None = None
+
+    def stop(self) -> None:
+        """Ask the runner to stop; wakes it immediately if it is waiting."""
+        self._stop_event.set()
 
     def _execute_or_log(self, action_name: str, action: Callable) -> None:
         """Execute an action or log it if in dry-run mode.
@@ -40,12 +86,18 @@ class MissionRunner:
             action()
 
     def _accept_matching_missions(self, mission_text: str, category: str) -> int:
-        accepted = 0
         credit_value = self._extract_credit_value(mission_text)
+        if self._debug:
+            logger.debug("Extracted credit value: %s", credit_value)
 
-        rules_for_category = self.registry.get_rules_for_category(category)
-        for rule in rules_for_category:
-            if self._should_accept_mission(rule, mission_text, credit_value):
+        # Every rule needs a reward above its threshold, so there is nothing
+        # to match without one.
+        if credit_value is None:
+            return 0
+
+        accepted = 0
+        for rule in self.registry.match(mission_text, category):
+            if self._should_accept_mission(rule, credit_value):
                 logger.info("%s mission detected. Accepting...", rule.primary_label)
 
                 self._execute_or_log("accept mission", self.game.accept_mission)
@@ -66,16 +118,29 @@ class MissionRunner:
     def _should_accept_mission(
         self,
         rule: MissionRule,
-        mission_text: str,
         credit_value: Optional[int],
     ) -> bool:
-        if not rule.matches(mission_text):
+        """Check the non-text criteria of a rule whose needles already matched.
+
+        The credit comparison runs first so the wing icon is only captured
+        for missions that are worth accepting.
+        """
+        if credit_value is None:
+            return False
+        if credit_value <= rule.value:
+            if self._debug:
+                logger.debug(
+                    "Credit value %s did not exceed rule threshold %s",
+                    credit_value,
+                    rule.value,
+                )
             return False
 
         if rule.wing:
             try:
                 wing_result = self.game.check_wing_mission()
-                logger.debug("Wing check result: %s", wing_result)
+                if self._debug:
+                    logger.debug("Wing check result: %s", wing_result)
                 if not wing_result:
                     return False
             except NotImplementedError:
@@ -84,43 +149,14 @@ class MissionRunner:
                 )
                 return False
 
-        logger.debug("Extracted credit value: %s", credit_value)
-        if credit_value is None:
-            return False
-        if credit_value <= rule.value:
-            logger.debug(
-                "Credit value %s did not exceed rule threshold %s",
-                credit_value,
-                rule.value,
-            )
-            return False
-
         return True
 
     @staticmethod
     def _extract_credit_value(mission_text: str) -> Optional[int]:
-        upper_text = mission_text.upper()
-        idx = upper_text.find("CR")
-        if idx == -1:
-            return None
-
-        i = idx - 1
-        digits: list[str] = []
-        while i >= 0 and (mission_text[i].isdigit() or mission_text[i] == ","):
-            digits.append(mission_text[i])
-            i -= 1
-
-        if not digits:
-            return None
-
-        num_str = "".join(reversed(digits)).replace(",", "")
-        if not num_str:
-            return None
-
-        try:
-            return int(num_str)
-        except ValueError:
+        match = _CREDIT_RE.search(mission_text)
+        if match is None:
             return None
+        return int(match.group(1).replace(",", ""))
 
     def _scan_category(self, category: str) -> int:
         missions_accepted = 0
@@ -131,18 +167,38 @@ class MissionRunner:
             lambda: self.game.navigate_to_category(category),
         )
 
-        while not self.game.at_bottom():
-            if self._should_stop():
-                raise InterruptedError("Stop requested")
+        # The row's OCR and the end-of-list check both read the settled
+        # screen, so Tesseract runs on a worker while the back button is
+        # compared.
+        if self._ocr_pool is None:
+            self._ocr_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ocr"
+            )
+        pending: Future[str] | None = None
+        try:
+            while True:
+                pending = self._ocr_pool.submit(self.game.ocr_mission)
+                if self.game.at_bottom():
+                    break
+                if self._should_stop():
+                    raise InterruptedError("Stop requested")
 
-            mission_text = self.game.ocr_mission()
-            missions_accepted += self._accept_matching_missions(mission_text, category)
+                mission_text = pending.result()
+                pending = None
+                missions_accepted += self._accept_matching_missions(
+                    mission_text, category
+                )
 
-            self._execute_or_log("move to next mission", self.game.next_mission)
+                self._execute_or_log("move to next mission", self.game.next_mission)
+        finally:
+            # Don't let a discarded read overlap whatever the game does next
+            if pending is not None and not pending.cancel():
+                wait([pending])
 
         return missions_accepted
 
     def run_once(self) -> int:
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         missions_accepted = 0
         categories = self.registry.get_unique_categories()
 
@@ -156,6 +212,7 @@ class MissionRunner:
 
         self._execute_or_log("open missions board", self.game.open_missions_board)
 
+        last_index = len(categories) - 1
         try:
             for i, category in enumerate(categories):
                 if self._should_stop():
@@ -163,8 +220,7 @@ class MissionRunner:
 
                 missions_accepted += self._scan_category(category)
 
-                is_last_category = i == len(categories) - 1
-                if not is_last_category:
+                if i != last_index:
                     self._execute_or_log(
                         "return to categories", self.game.return_to_categories
                     )
@@ -173,52 +229,69 @@ class MissionRunner:
             logger.info("Scan interrupted. Returning to starport...")
             self._execute_or_log("return to starport", self.game.return_to_starport)
             raise
+        finally:
+            # Polls are minutes apart; don't keep the worker (and its capture
+            # handle) alive in between or after the runner is done
+            if self._ocr_pool is not None:
+                self._ocr_pool.shutdown()
+                self._ocr_pool = None
 
         self._execute_or_log("return to starport", self.game.return_to_starport)
 
         logger.info("Mission check complete. Accepted %d missions.", missions_accepted)
         return missions_accepted
 
+    def _wait_until(self, deadline: float) -> bool:
+        """Wait until the monotonic ``deadline`` or until a stop is requested.
+
+        The stop event wakes the wait at once. It still times out every
+        loop_sleep_seconds so a should_stop callback is re-checked and
+        Ctrl+C is delivered on Windows, where a blocked wait ignores it.
+
+        Returns:
+            True if the deadline was reached, False if a stop was requested
+        """
+        while not self._should_stop():
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return True
+            self._stop_event.wait(min(remaining, self.config.loop_sleep_seconds))
+        return False
+
     def run_until_full(self, existing_missions: int = 0) -> int:
         total_missions = existing_missions + self.run_once()
 
         if self._should_stop():
             return total_missions
 
+        interval = self.config.poll_interval_minutes
+        offset = self.config.poll_offset_minutes
         logger.info(
-            "Script will now run every %s minutes, on the %s minute mark (e.g. %s:%02d)",
-            self.config.poll_interval_minutes,
-            self.config.poll_offset_minutes,
-            localtime()[3],
-            (round(localtime()[4], -1) + self.config.poll_offset_minutes) % 60,
+            "Script will now run every %s minutes, on the %s minute mark",
+            interval,
+            offset,
         )
 
-        mission_count_updated = True
+        last_mark = 0.0
         while total_missions < self.config.max_missions:
-            if self._should_stop():
+            logger.info("%s missions in depot.", total_missions)
+
+            # The next mark comes from the wall clock after every scan, so an
+            # interval that doesn't divide 60 still lands on its minute mark;
+            # only the wait itself runs on the monotonic clock. Counting from
+            # the last mark keeps a wait that ends a little early from
+            # targeting the same mark again.
+            now = max(time(), last_mark)
+            last_mark = now + seconds_until_next_poll(interval, offset, now)
+            next_fire = monotonic() + last_mark - time()
+            logger.info("Next update at %s", strftime("%H:%M", localtime(last_mark)))
+
+            if not self._wait_until(next_fire):
                 logger.info("Stop requested")
                 break
 
-            logger.debug("Current minute: %s", localtime()[4])
-
-            poll_check = (
-                localtime()[4] + self.config.poll_offset_minutes
-            ) % self.config.poll_interval_minutes
-
-            if poll_check == 0:
-                total_missions += self.run_once()
-                mission_count_updated = True
-
-            if mission_count_updated:
-                mission_count_updated = False
-                logger.info("%s missions in depot.", total_missions)
-                logger.info(
-                    "Next update at %s:%02d",
-                    localtime()[3],
-                    (round(localtime()[4], -1) + self.config.poll_offset_minutes) % 60,
-                )
-
-            sleep(self.config.loop_sleep_seconds)
+            total_missions += self.run_once()
 
-        logger.info("Mission depot full with %d missions.", total_missions)
+        if total_missions >= self.config.max_missions:
+            logger.info("Mission depot full with %d missions.", total_missions)
         return total_missions
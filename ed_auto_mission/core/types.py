@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Protocol, runtime_checkable
+from functools import lru_cache
+from typing import Iterable, Protocol, runtime_checkable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScreenRegion:
     """A rectangular region on screen, defined at a reference resolution."""
 
@@ -17,17 +19,20 @@ class ScreenRegion:
     ref_width: int = 3840
     ref_height: int = 2160
 
+    @lru_cache(maxsize=256)
     def scaled(
         self, screen_width: int, screen_height: int
     ) -> tuple[int, int, int, int]:
-        """Return (x, y, width, height) scaled to the given screen dimensions."""
-        scale_x = screen_width / self.ref_width
-        scale_y = screen_height / self.ref_height
+        """Return (x, y, width, height) scaled to the given screen dimensions.
+
+        Results are memoised per region and resolution. Scaling is done in
+        exact integer arithmetic, so no float rounding shifts a coordinate.
+        """
         return (
-            int(self.x * scale_x),
-            int(self.y * scale_y),
-            int(self.width * scale_x),
-            int(self.height * scale_y),
+            self.x * screen_width // self.ref_width,
+            self.y * screen_height // self.ref_height,
+            self.width * screen_width // self.ref_width,
+            self.height * screen_height // self.ref_height,
         )
 
     def as_tuple(
@@ -48,45 +53,80 @@ class ScreenContext:
 
     def scale_x(self, value: int) -> int:
         """Scale an x-coordinate from reference to current resolution."""
-        return int(value * self.width / self.ref_width)
+        return value * self.width // self.ref_width
 
     def scale_y(self, value: int) -> int:
         """Scale a y-coordinate from reference to current resolution."""
-        return int(value * self.height / self.ref_height)
+        return value * self.height // self.ref_height
 
     def scale_region(self, region: ScreenRegion) -> tuple[int, int, int, int]:
         """Scale a ScreenRegion to current screen dimensions."""
         return region.scaled(self.width, self.height)
 
 
-@dataclass(frozen=True)
+def _fold_needles(group: Iterable[str]) -> tuple[str, ...]:
+    """
+    Drop needles that contain a shorter needle of the same group.
+
+    Within a group any one needle is enough, and text containing "BLASTING"
+    always contains "BLAST", so the longer needle never changes the result.
+    """
+    kept: list[str] = []
+    for needle in sorted(dict.fromkeys(group), key=len):
+        if not any(shorter in needle for shorter in kept):
+            kept.append(needle)
+    return tuple(kept)
+
+
+@dataclass(frozen=True, slots=True)
 class MissionRule:
     """
     Describes how to detect and label a mission.
 
-    - needles: list of needle groups (AND across groups, OR within each group)
+    - needles: needle groups (AND across groups, OR within each group), stored
+      as interned tuples whatever sequence type is passed in
     - label: display/logging label
     - wing: whether this is a wing mission
     - value: minimum credit value threshold
     - categories: list of category names this mission belongs to
     """
 
-    needles: list[list[str]]
+    needles: tuple[tuple[str, ...], ...]
     label: str
     wing: bool = False
     value: int = 0
     categories: tuple[str, ...] = field(default_factory=tuple)
+    needles_upper: tuple[tuple[str, ...], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        needles = tuple(
+            tuple(sys.intern(needle) for needle in group) for group in self.needles
+        )
+        object.__setattr__(self, "needles", needles)
+        object.__setattr__(
+            self,
+            "needles_upper",
+            tuple(
+                _fold_needles(sys.intern(n.upper()) for n in group)
+                for group in needles
+            ),
+        )
 
     def matches(self, text: str) -> bool:
         """
         Return True when each group has at least one needle contained in the OCR text.
         (AND across groups, OR within each group)
         """
-        upper_text = text.upper()
-        for group in self.needles:
-            if not any(needle.upper() in upper_text for needle in group):
-                return False
-        return True
+        return self.matches_upper(text.upper())
+
+    def matches_upper(self, upper_text: str) -> bool:
+        """Like matches(), for text the caller has already upper-cased."""
+        return all(
+            any(needle in upper_text for needle in group)
+            for group in self.needles_upper
+        )
 
     @property
     def primary_label(self) -> str:
@@ -118,7 +158,10 @@ class GameInteraction(Protocol):
         ...
 
     def ocr_mission(self) -> str:
-        """Read the currently highlighted mission text via OCR."""
+        """Read the currently highlighted mission text via OCR.
+
+        Called from a worker thread while at_bottom() runs on the caller's.
+        """
         ...
 
     def accept_mission(self) -> None:
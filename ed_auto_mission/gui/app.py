@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import logging
 import queue
+import threading
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,14 +23,66 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Oldest lines are trimmed from the log view beyond this
+MAX_LOG_LINES = 2000
+
+# Share of the mission list width given to each column
+_COLUMN_FRACTIONS = (
+    ("label", 0.15),
+    ("needles", 0.45),
+    ("wing", 0.08),
+    ("min_value", 0.12),
+    ("categories", 0.20),
+)
+
+
+@lru_cache(maxsize=1024)
+def _display_row(rule: MissionRule) -> tuple[str, str, str, str, str]:
+    """Treeview values for a rule; rules are frozen, so rows are cached."""
+    needles_str = " AND ".join([f"({'|'.join(group)})" for group in rule.needles])
+    categories_str = ", ".join(rule.categories) if rule.categories else "-"
+    return (
+        rule.label,
+        needles_str,
+        "Yes" if rule.wing else "No",
+        f"{rule.value:,}" if rule.value else "-",
+        categories_str,
+    )
+
+
+def _categories_as_tuple(obj: dict) -> dict:
+    """json object_hook turning a rule's category list into a tuple as it loads."""
+    categories = obj.get("categories")
+    if isinstance(categories, list):
+        obj["categories"] = tuple(categories)
+    return obj
+
+
+class _LogFormatter(logging.Formatter):
+    """Formatter that reuses the timestamp string for records in the same second."""
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._last_second = -1
+        self._last_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_time = super().formatTime(record, datefmt)
+        return self._last_time
+
 
 class QueueHandler(logging.Handler):
-    def __init__(self, log_queue: queue.Queue):
+    """Hands records to the GUI thread unformatted; formatting happens there."""
+
+    def __init__(self, log_queue: queue.SimpleQueue):
         super().__init__()
         self.log_queue = log_queue
 
     def emit(self, record: logging.LogRecord) -> None:
-        self.log_queue.put(self.format(record))
+        self.log_queue.put_nowait(record)
 
 
 class EDAutoMissionApp:
@@ -41,7 +95,11 @@ class EDAutoMissionApp:
         self.registry = MissionRegistry(DEFAULT_MISSIONS)
         self.config = AppConfig.from_env()
         self.runner_thread: RunnerThread | None = None
-        self.log_queue: queue.Queue = queue.Queue()
+        self.log_queue: queue.SimpleQueue[logging.LogRecord | str] = queue.SimpleQueue()
+        self._resize_after_id: str | None = None
+        self._idle_log_ticks = 0
+        self._last_tree_width = -1
+        self._last_root_size = (-1, -1)
 
         self._setup_logging()
         self._create_menu()
@@ -49,6 +107,10 @@ class EDAutoMissionApp:
         self._populate_mission_list()
         self._consume_logs()
 
+        threading.Thread(
+            target=self._preload_services, name="preload-services", daemon=True
+        ).start()
+
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.root.bind("<Configure>", self._on_window_resize)
@@ -74,9 +136,10 @@ class EDAutoMissionApp:
     def _setup_logging(self) -> None:
         handler = QueueHandler(self.log_queue)
         handler.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", "%H:%M:%S")
+            _LogFormatter("%(asctime)s [%(levelname)s] %(message)s", "%H:%M:%S")
         )
         handler.setLevel(logging.INFO)
+        self._log_handler = handler
 
         root_logger = logging.getLogger()
         root_logger.addHandler(handler)
@@ -116,7 +179,7 @@ class EDAutoMissionApp:
         list_frame = ttk.LabelFrame(top_frame, text="Mission Rules", padding=5)
         list_frame.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
 
-        columns = ("label", "needles", "wing", "min_value", "categories")
+        columns = tuple(col for col, _ in _COLUMN_FRACTIONS)
         self.mission_tree = ttk.Treeview(
             list_frame, columns=columns, show="headings", selectmode="browse"
         )
@@ -170,7 +233,14 @@ class EDAutoMissionApp:
         log_frame = ttk.LabelFrame(bottom_frame, text="Log", padding=5)
         log_frame.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
 
-        self.log_text = tk.Text(log_frame, state=tk.DISABLED, wrap=tk.WORD)
+        self.log_text = tk.Text(
+            log_frame,
+            state=tk.DISABLED,
+            wrap=tk.WORD,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+        )
         log_scroll = ttk.Scrollbar(
             log_frame, orient=tk.VERTICAL, command=self.log_text.yview
         )
@@ -206,47 +276,46 @@ class EDAutoMissionApp:
         ).pack(pady=5)
 
     def _on_treeview_resize(self) -> None:
+        self._resize_after_id = None
         tree_width = self.mission_tree.winfo_width()
 
+        # Window moves and height-only changes leave the columns as they are
+        if tree_width == self._last_tree_width:
+            return
+        self._last_tree_width = tree_width
+
         if tree_width > 100:
             scrollbar_width = 20
             available_width = tree_width - scrollbar_width
 
-            widths = {
-                "label": available_width * 0.15,
-                "needles": available_width * 0.45,
-                "wing": available_width * 0.08,
-                "min_value": available_width * 0.12,
-                "categories": available_width * 0.20,
-            }
-
-            for col, width in widths.items():
-                self.mission_tree.column(col, width=int(width))
+            for col, fraction in _COLUMN_FRACTIONS:
+                self.mission_tree.column(col, width=int(available_width * fraction))
 
     def _on_window_resize(self, event) -> None:
         if event.widget == self.root:
-            self.root.after(50, self._on_treeview_resize)
+            # <Configure> also fires when the window is only moved
+            size = (event.width, event.height)
+            if size == self._last_root_size:
+                return
+            self._last_root_size = size
+
+            # Coalesce a drag's stream of <Configure> events into one relayout
+            if self._resize_after_id is not None:
+                self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.root.after(100, self._on_treeview_resize)
 
     def _populate_mission_list(self) -> None:
-        for item in self.mission_tree.get_children():
-            self.mission_tree.delete(item)
-
-        for rule in self.registry.all():
-            needles_str = " AND ".join(
-                "(" + "|".join(group) + ")" for group in rule.needles
-            )
-            categories_str = ", ".join(rule.categories) if rule.categories else "-"
-            self.mission_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    rule.label,
-                    needles_str,
-                    "Yes" if rule.wing else "No",
-                    f"{rule.value:,}" if rule.value else "-",
-                    categories_str,
-                ),
-            )
+        # Detach the scrollbar while rebuilding so it is updated once at the
+        # end rather than after every insert.
+        yscrollcommand = self.mission_tree.cget("yscrollcommand")
+        self.mission_tree.configure(yscrollcommand="")
+
+        self.mission_tree.delete(*self.mission_tree.get_children())
+
+        for rule in self.registry:
+            self.mission_tree.insert("", tk.END, values=_display_row(rule))
+
+        self.mission_tree.configure(yscrollcommand=yscrollcommand)
 
     def _add_mission(self) -> None:
         dialog = MissionEditorDialog(self.root, "Add Mission")
@@ -262,24 +331,14 @@ class EDAutoMissionApp:
             return
 
         idx = self.mission_tree.index(selection[0])
-        rules = self.registry.all()
-        if idx >= len(rules):
+        if idx >= len(self.registry):
             return
 
-        rule = rules[idx]
+        rule = self.registry[idx]
         dialog = MissionEditorDialog(self.root, "Edit Mission", rule)
         if dialog.result:
-            self.registry.remove(rule)
-            all_rules = self.registry.all()
-            self.registry.clear()
-            for i, r in enumerate(all_rules):
-                if i == idx:
-                    self.registry.add_rule(dialog.result)
-                self.registry.add_rule(r)
-            if idx >= len(all_rules):
-                self.registry.add_rule(dialog.result)
-
-            self._populate_mission_list()
+            self.registry.replace_at(idx, dialog.result)
+            self.mission_tree.item(selection[0], values=_display_row(dialog.result))
             self._log("Updated mission rule: " + dialog.result.label)
 
     def _remove_mission(self) -> None:
@@ -289,16 +348,15 @@ class EDAutoMissionApp:
             return
 
         idx = self.mission_tree.index(selection[0])
-        rules = self.registry.all()
-        if idx >= len(rules):
+        if idx >= len(self.registry):
             return
 
-        rule = rules[idx]
+        rule = self.registry[idx]
         if messagebox.askyesno(
             "Confirm Remove", f"Remove mission rule '{rule.label}'?"
         ):
             self.registry.remove(rule)
-            self._populate_mission_list()
+            self.mission_tree.delete(selection[0])
             self._log("Removed mission rule: " + rule.label)
 
     def _move_up(self) -> None:
@@ -310,15 +368,8 @@ class EDAutoMissionApp:
         if idx == 0:
             return
 
-        rules = self.registry.all()
-        self.registry.clear()
-        rules[idx], rules[idx - 1] = rules[idx - 1], rules[idx]
-        self.registry.add_many(rules)
-        self._populate_mission_list()
-
-        children = self.mission_tree.get_children()
-        if idx - 1 < len(children):
-            self.mission_tree.selection_set(children[idx - 1])
+        self.registry.swap(idx, idx - 1)
+        self.mission_tree.move(selection[0], "", idx - 1)
 
     def _move_down(self) -> None:
         selection = self.mission_tree.selection()
@@ -326,18 +377,11 @@ class EDAutoMissionApp:
             return
 
         idx = self.mission_tree.index(selection[0])
-        rules = self.registry.all()
-        if idx >= len(rules) - 1:
+        if idx >= len(self.registry) - 1:
             return
 
-        self.registry.clear()
-        rules[idx], rules[idx + 1] = rules[idx + 1], rules[idx]
-        self.registry.add_many(rules)
-        self._populate_mission_list()
-
-        children = self.mission_tree.get_children()
-        if idx + 1 < len(children):
-            self.mission_tree.selection_set(children[idx + 1])
+        self.registry.swap(idx, idx + 1)
+        self.mission_tree.move(selection[0], "", idx + 1)
 
     def _toggle_runner(self) -> None:
         if self.runner_thread and self.runner_thread.is_alive():
@@ -345,6 +389,19 @@ class EDAutoMissionApp:
         else:
             self._start_runner()
 
+    @staticmethod
+    def _preload_services() -> None:
+        # Import the heavy service stack (pytesseract, cv2, mss, pyautogui,
+        # psutil, ...) off the Tk thread so pressing Start doesn't stall the
+        # window. Failures are reported by _start_runner when it imports them.
+        try:
+            import ed_auto_mission.main  # noqa: F401
+            import ed_auto_mission.services.ocr  # noqa: F401
+            import ed_auto_mission.services.process  # noqa: F401
+            import ed_auto_mission.services.window  # noqa: F401
+        except Exception as e:
+            logger.debug("Service preload failed: %s", e)
+
     def _start_runner(self) -> None:
         try:
             initial = int(self.initial_missions_var.get())
@@ -408,8 +465,7 @@ class EDAutoMissionApp:
         if messagebox.askyesno(
             "Reset to Defaults", "Reset all mission rules to defaults?"
         ):
-            self.registry.clear()
-            self.registry.add_many(DEFAULT_MISSIONS)
+            self.registry.replace_all(DEFAULT_MISSIONS)
             self._populate_mission_list()
             self._log("Mission rules reset to defaults")
 
@@ -421,28 +477,39 @@ class EDAutoMissionApp:
         if not path:
             return
 
+        threading.Thread(
+            target=self._load_missions_file, args=(path,), daemon=True
+        ).start()
+
+    def _load_missions_file(self, path: str) -> None:
+        # Runs on a worker thread; results are handed back to the Tk thread.
         try:
             with open(path, "r") as f:
-                data = json.load(f)
-
-            self.registry.clear()
-            for item in data:
-                categories = item.get("categories", [])
-                if isinstance(categories, list):
-                    categories = tuple(categories)
-                rule = MissionRule(
+                data = json.load(f, object_hook=_categories_as_tuple)
+
+            rules = [
+                MissionRule(
                     needles=item["needles"],
                     label=item["label"],
                     wing=item.get("wing", False),
                     value=item.get("value", 0),
-                    categories=categories,
+                    categories=item.get("categories", ()),
                 )
-                self.registry.add_rule(rule)
+                for item in data
+            ]
+        except Exception as e:
+            # Anything left uncaught here would end the thread with no dialog
+            message = f"Failed to import: {e}"
+            self.root.after(0, lambda: messagebox.showerror("Import Error", message))
+            return
 
-            self._populate_mission_list()
-            self._log(f"Imported {len(data)} missions from {Path(path).name}")
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            messagebox.showerror("Import Error", f"Failed to import: {e}")
+        name = Path(path).name
+        self.root.after(0, lambda: self._apply_imported_missions(rules, name))
+
+    def _apply_imported_missions(self, rules: list[MissionRule], name: str) -> None:
+        self.registry.replace_all(rules)
+        self._populate_mission_list()
+        self._log(f"Imported {len(rules)} missions from {name}")
 
     def _export_missions(self) -> None:
         path = filedialog.asksaveasfilename(
@@ -462,7 +529,7 @@ class EDAutoMissionApp:
                     "value": rule.value,
                     "categories": list(rule.categories),
                 }
-                for rule in self.registry.all()
+                for rule in self.registry
             ]
 
             with open(path, "w") as f:
@@ -489,17 +556,41 @@ class EDAutoMissionApp:
         self.log_text.configure(state=tk.DISABLED)
 
     def _consume_logs(self) -> None:
+        messages: list[str] = []
         try:
             while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.configure(state=tk.NORMAL)
-                self.log_text.insert(tk.END, message + "\n")
-                self.log_text.see(tk.END)
-                self.log_text.configure(state=tk.DISABLED)
+                item = self.log_queue.get_nowait()
+                if isinstance(item, logging.LogRecord):
+                    item = self._log_handler.format(item)
+                messages.append(item)
         except queue.Empty:
             pass
 
-        self.root.after(100, self._consume_logs)
+        # One insert per tick, however many records arrived since the last
+        if messages:
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+
+            lines = int(self.log_text.index("end-1c").split(".")[0])
+            excess = lines - MAX_LOG_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+
+            self.log_text.see(tk.END)
+            self.log_text.configure(state=tk.DISABLED)
+
+        # Poll every 100 ms while records are flowing, backing off to 500 ms
+        # when idle and to once a second while the window is minimised.
+        if messages:
+            self._idle_log_ticks = 0
+            interval = 100
+        else:
+            self._idle_log_ticks += 1
+            interval = min(500, 100 + self._idle_log_ticks * 50)
+        if not self.root.winfo_viewable():
+            interval = 1000
+
+        self.root.after(interval, self._consume_logs)
 
     def _on_close(self) -> None:
         if self.runner_thread and self.runner_thread.is_alive():
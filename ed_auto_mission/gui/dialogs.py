@@ -23,6 +23,9 @@ AVAILABLE_CATEGORIES = [
     "thargoid",
 ]
 
+# Strips thousands separators from the Min Value field
+_STRIP_COMMAS = str.maketrans("", "", ",")
+
 
 class BaseDialog(tk.Toplevel, ABC):
     """Base class for dialog windows with common setup logic."""
@@ -47,21 +50,25 @@ class BaseDialog(tk.Toplevel, ABC):
             min_height: Minimum height
         """
         super().__init__(parent)
+        # Stay hidden until placed so the window is mapped once, already
+        # centred, instead of appearing at the origin and jumping.
+        self.withdraw()
         self.title(title)
-        self.geometry(f"{width}x{height}")
         self.minsize(min_width, min_height)
         self.resizable(True, True)
         self.transient(parent)
-        self.grab_set()
 
-        # Create widgets before centering
         self._create_widgets()
 
         # Center dialog on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        x = parent.winfo_x() + (parent.winfo_width() - width) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - height) // 2
+        self.geometry(f"{width}x{height}+{x}+{y}")
+        self.deiconify()
+
+        # A grab needs a viewable window
+        self.wait_visibility()
+        self.grab_set()
 
         self.wait_window()
 
@@ -115,9 +122,7 @@ class MissionEditorDialog(BaseDialog):
         pattern_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
         if self.rule:
-            pattern_lines = []
-            for group in self.rule.needles:
-                pattern_lines.append(" | ".join(group))
+            pattern_lines = [" | ".join(group) for group in self.rule.needles]
             self.pattern_text.insert(1.0, "\n".join(pattern_lines))
 
         ttk.Label(
@@ -186,12 +191,10 @@ class MissionEditorDialog(BaseDialog):
             return
 
         needles: list[list[str]] = []
-        for line in pattern_text.split("\n"):
-            line = line.strip()
-            if line:
-                group = [p.strip().upper() for p in line.split("|") if p.strip()]
-                if group:
-                    needles.append(group)
+        for line in pattern_text.upper().splitlines():
+            group = [p for p in map(str.strip, line.split("|")) if p]
+            if group:
+                needles.append(group)
 
         if not needles:
             messagebox.showerror(
@@ -200,7 +203,7 @@ class MissionEditorDialog(BaseDialog):
             return
 
         try:
-            value = int(self.value_var.get().replace(",", "").strip() or "0")
+            value = int(self.value_var.get().translate(_STRIP_COMMAS).strip() or "0")
         except ValueError:
             messagebox.showerror("Validation Error", "Min Value must be a number.")
             return
@@ -6,6 +6,11 @@ import logging
 import threading
 from typing import Callable, TYPE_CHECKING
 
+from ed_auto_mission.core.mission_runner import MissionRunner
+from ed_auto_mission.core.types import RunnerConfig
+from ed_auto_mission.services.discord import setup_discord_logging
+from ed_auto_mission.services.timing import set_stop_event
+
 if TYPE_CHECKING:
     from ed_auto_mission.core.mission_registry import MissionRegistry
     from ed_auto_mission.core.config import AppConfig
@@ -38,26 +43,20 @@ class RunnerThread(threading.Thread):
         return self._stop_event.is_set()
 
     def run(self) -> None:
-        from ed_auto_mission.services.timing import set_stop_check, clear_stop_check
-
         total = 0
         try:
-            set_stop_check(self.is_stop_requested)
+            set_stop_event(self._stop_event)
             total = self._run_automation()
         except InterruptedError:
             logger.info("Runner interrupted")
         except Exception as e:
             logger.error("Runner error: %s", e, exc_info=True)
         finally:
-            clear_stop_check()
+            set_stop_event(None)
             if self.on_complete:
                 self.on_complete(total)
 
     def _run_automation(self) -> int:
-        from ed_auto_mission.core.types import RunnerConfig
-        from ed_auto_mission.core.mission_runner import MissionRunner
-        from ed_auto_mission.services.discord import setup_discord_logging
-
         setup_discord_logging(self.config.discord_webhook_url)
 
         runner_config = RunnerConfig(
@@ -72,44 +71,9 @@ class RunnerThread(threading.Thread):
             self.game,
             self.registry,
             runner_config,
-            should_stop=self.is_stop_requested,
-        )
-
-        return self._run_with_stop_check(runner, self.initial_missions)
-
-    def _run_with_stop_check(self, runner, initial: int) -> int:
-        from time import localtime
-        from ed_auto_mission.services.timing import sleep
-
-        total_missions = initial + runner.run_once()
-
-        if self._stop_event.is_set():
-            return total_missions
-
-        logger.info(
-            "Will poll every %d minutes on the %d minute mark",
-            runner.config.poll_interval_minutes,
-            runner.config.poll_offset_minutes,
+            stop_event=self._stop_event,
         )
 
-        while total_missions < runner.config.max_missions:
-            if self._stop_event.is_set():
-                logger.info("Runner stopped by user")
-                break
-
-            poll_check = (
-                localtime()[4] + runner.config.poll_offset_minutes
-            ) % runner.config.poll_interval_minutes
-
-            if poll_check == 0:
-                if self._stop_event.is_set():
-                    break
-                total_missions += runner.run_once()
-                logger.info("%d missions in depot", total_missions)
-
-            sleep(runner.config.loop_sleep_seconds)
-
-        if total_missions >= runner.config.max_missions:
-            logger.info("Mission depot full with %d missions", total_missions)
-
-        return total_missions
+        # MissionRunner schedules polls on the monotonic clock and wakes on
+        # the shared stop event, so the thread just delegates to it.
+        return runner.run_until_full(self.initial_missions)
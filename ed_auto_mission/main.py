@@ -102,14 +102,18 @@ def get_initial_mission_count(
     Returns:
         Number of currently accepted missions
     """
-    try:
-        user_input = input(
-            "Enter number of currently accepted missions (or press Enter for auto-detect): "
-        ).strip()
-        if user_input:
-            return int(user_input)
-    except (EOFError, ValueError):
-        pass
+    if config.interactive:
+        try:
+            user_input = input(
+                "Enter number of currently accepted missions (or press Enter for auto-detect): "
+            ).strip()
+            if user_input:
+                return int(user_input)
+        except (EOFError, ValueError):
+            pass
+
+    logger.info("Detecting number of accepted missions")
+    return game.check_missions_accepted()
 
 
 def start(
@@ -5,6 +5,7 @@ Services are imported lazily to avoid triggering pyautogui/X11 at module load.
 
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 # Lazy imports - only resolve when actually accessed
@@ -21,51 +22,37 @@ if TYPE_CHECKING:
     from ed_auto_mission.services.window import focus_window, WindowFocusError
 
 
-def __getattr__(name: str):
-    """Lazy import handler."""
-    if name in ("ScreenService", "get_screen_context"):
-        from ed_auto_mission.services.screen import ScreenService, get_screen_context
-
-        return ScreenService if name == "ScreenService" else get_screen_context
-
-    if name in ("OCRService", "setup_tesseract"):
-        from ed_auto_mission.services.ocr import OCRService, setup_tesseract
-
-        return OCRService if name == "OCRService" else setup_tesseract
-
-    if name in ("DiscordWebhookHandler", "setup_discord_logging"):
-        from ed_auto_mission.services.discord import (
-            DiscordWebhookHandler,
-            setup_discord_logging,
-        )
-
-        return (
-            DiscordWebhookHandler
-            if name == "DiscordWebhookHandler"
-            else setup_discord_logging
-        )
-
-    if name in ("slight_random_time", "random_delay"):
-        from ed_auto_mission.services.timing import slight_random_time, random_delay
+# Public name -> module that defines it
+_LAZY = {
+    "ScreenService": "ed_auto_mission.services.screen",
+    "get_screen_context": "ed_auto_mission.services.screen",
+    "OCRService": "ed_auto_mission.services.ocr",
+    "setup_tesseract": "ed_auto_mission.services.ocr",
+    "DiscordWebhookHandler": "ed_auto_mission.services.discord",
+    "setup_discord_logging": "ed_auto_mission.services.discord",
+    "slight_random_time": "ed_auto_mission.services.timing",
+    "random_delay": "ed_auto_mission.services.timing",
+    "is_game_running": "ed_auto_mission.services.process",
+    "InputService": "ed_auto_mission.services.input",
+    "focus_window": "ed_auto_mission.services.window",
+    "WindowFocusError": "ed_auto_mission.services.window",
+}
 
-        return slight_random_time if name == "slight_random_time" else random_delay
 
-    if name == "is_game_running":
-        from ed_auto_mission.services.process import is_game_running
-
-        return is_game_running
-
-    if name == "InputService":
-        from ed_auto_mission.services.input import InputService
-
-        return InputService
-
-    if name in ("focus_window", "WindowFocusError"):
-        from ed_auto_mission.services.window import focus_window, WindowFocusError
-
-        return focus_window if name == "focus_window" else WindowFocusError
-
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str):
+    """Lazy import handler.
+
+    The resolved object is stored in the module globals, so later lookups
+    find it directly and no longer reach this hook.
+    """
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import logging
-from urllib import request
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler
 from typing import Optional
+from urllib.parse import urlsplit
+
+try:
+    # Optional; encodes straight to UTF-8 bytes
+    from orjson import dumps as _json_bytes
+except ImportError:
+
+    def _json_bytes(obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 logger = logging.getLogger(__name__)
 
@@ -13,32 +27,200 @@ logger = logging.getLogger(__name__)
 DISCORD_LEVEL = logging.INFO + 5
 logging.addLevelName(DISCORD_LEVEL, "DISCORD")
 
+# Records waiting to be posted; further records are dropped while it is full
+QUEUE_SIZE = 1000
 
-class DiscordWebhookHandler(logging.Handler):
-    """Logging handler that sends log records to a Discord webhook."""
+# Records arriving within BATCH_WINDOW seconds of the first are sent as one
+# message, up to BATCH_RECORDS distinct lines or BATCH_CHARS characters
+# (Discord rejects content over 2000)
+BATCH_WINDOW = 0.5
+BATCH_RECORDS = 10
+BATCH_CHARS = 1900
 
-    def __init__(self, webhook_url: str, level: int = DISCORD_LEVEL):
-        super().__init__(level=level)
-        self.webhook_url = webhook_url
+# Times a rate-limited (HTTP 429) post is retried after its Retry-After delay
+RATE_LIMIT_RETRIES = 3
+
+_STOP = object()
+
+
+class _DiscordSink(logging.Handler):
+    """Posts messages to the webhook, reusing one keep-alive connection.
+
+    Only the listener thread calls this handler.
+    """
+
+    def __init__(self, webhook_url: str, timeout: float = 5.0):
+        super().__init__()
+        parts = urlsplit(webhook_url)
+        self._connection_class = (
+            http.client.HTTPConnection
+            if parts.scheme == "http"
+            else http.client.HTTPSConnection
+        )
+        self._host = parts.netloc
+        self._path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        self._timeout = timeout
+        self._connection: http.client.HTTPConnection | None = None
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Send the log record to the Discord webhook."""
+        self.send(self.format(record), record)
+
+    def send(self, content: str, record: logging.LogRecord) -> None:
+        """Post one message; ``record`` is reported if the post fails."""
         try:
-            message = self.format(record)
-            payload = json.dumps({"content": message}).encode("utf-8")
-
-            req = request.Request(
-                self.webhook_url,
-                data=payload,
-                headers={"Content-Type": "application/json"},
-                method="POST",
+            self._post(_json_bytes({"content": content}))
+        except Exception:
+            self.handleError(record)
+
+    def _post(self, payload: bytes) -> None:
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        reconnected = False
+        rate_limited = 0
+        while True:
+            if self._connection is None:
+                self._connection = self._connection_class(
+                    self._host, timeout=self._timeout
+                )
+            try:
+                self._connection.request(
+                    "POST", self._path, body=payload, headers=headers
+                )
+                response = self._connection.getresponse()
+                response.read()
+            except (http.client.BadStatusLine, ConnectionError):
+                # Discord dropped the idle connection; reconnect and retry once
+                self._disconnect()
+                if reconnected:
+                    raise
+                reconnected = True
+                continue
+            except Exception:
+                self._disconnect()
+                raise
+
+            if response.status == 429 and rate_limited < RATE_LIMIT_RETRIES:
+                # Only this thread waits; new records queue up meanwhile
+                rate_limited += 1
+                time.sleep(_retry_after(response))
+                continue
+            if response.status >= 400:
+                raise http.client.HTTPException(
+                    f"Discord webhook returned HTTP {response.status}"
+                )
+            return
+
+    def _disconnect(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def close(self) -> None:
+        self._disconnect()
+        super().close()
+
+
+def _retry_after(response: http.client.HTTPResponse) -> float:
+    try:
+        return max(float(response.getheader("Retry-After", "1")), 0.0)
+    except ValueError:
+        return 1.0
+
+
+class _DiscordListener:
+    """Background thread that drains the queue into batched webhook posts."""
+
+    def __init__(self, records: queue.Queue, sink: _DiscordSink):
+        self._queue = records
+        self._sink = sink
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="discord-webhook", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Post everything queued so far, then end the thread."""
+        if self._thread is None:
+            return
+        # Wait for room so this still works while the queue is full
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        held = None
+        while True:
+            record = held if held is not None else self._queue.get()
+            held = None
+            if record is _STOP:
+                return
+
+            lines = [self._sink.format(record)]
+            counts = [1]
+            size = len(lines[0])
+            deadline = time.monotonic() + BATCH_WINDOW
+            while len(lines) < BATCH_RECORDS:
+                try:
+                    extra = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if extra is _STOP:
+                    held = extra
+                    break
+                line = self._sink.format(extra)
+                if line == lines[-1]:
+                    # Repeats collapse into one line; the " (×N)" suffixes fit
+                    # in the slack between BATCH_CHARS and Discord's limit
+                    counts[-1] += 1
+                    continue
+                if size + 1 + len(line) > BATCH_CHARS:
+                    held = extra
+                    break
+                lines.append(line)
+                counts.append(1)
+                size += 1 + len(line)
+
+            content = "\n".join(
+                line if count == 1 else f"{line} (×{count})"
+                for line, count in zip(lines, counts)
             )
+            self._sink.send(content, record)
 
-            with request.urlopen(req, timeout=5):
-                pass
 
-        except Exception:
-            self.handleError(record)
+class DiscordWebhookHandler(QueueHandler):
+    """Logging handler that sends log records to a Discord webhook.
+
+    Records are queued and posted by a background listener thread, so
+    logging never waits on the network. Records logged close together are
+    combined into one message.
+    """
+
+    def __init__(self, webhook_url: str, level: int = DISCORD_LEVEL):
+        super().__init__(queue.Queue(QUEUE_SIZE))
+        self.setLevel(level)
+        self.webhook_url = webhook_url
+        self._sink = _DiscordSink(webhook_url)
+        self._listener: _DiscordListener | None = _DiscordListener(
+            self.queue, self._sink
+        )
+        self._listener.start()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Drop rather than stall the caller behind a slow webhook
+            pass
+
+    def close(self) -> None:
+        """Post whatever is still queued, then stop the listener."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+        self._sink.close()
+        super().close()
 
 
 def setup_discord_logging(
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from typing import Literal
 
 if sys.platform == "win32":
+    import ctypes
+
     import pydirectinput as _input_backend
 else:
     import pyautogui as _input_backend
@@ -15,6 +18,13 @@ from ed_auto_mission.services.timing import slight_random_time, sleep
 
 logger = logging.getLogger(__name__)
 
+# How long a key is held down; the game samples input once per frame, so a
+# press with no hold time can be missed
+KEY_HOLD_SECONDS = 0.05
+
+# Keys that need pydirectinput's extended-key and NumLock handling
+_EXTENDED_KEYS = frozenset({"up", "down", "left", "right"})
+
 
 class InputService:
     """Service for sending keyboard and mouse input to the game."""
@@ -27,6 +37,7 @@ class InputService:
             dry_run: If True, log inputs but don't send them
         """
         self._dry_run = dry_run
+        self._key_inputs: dict[str, tuple[object, object] | None] = {}
 
     def press(
         self,
@@ -52,7 +63,34 @@ class InputService:
             return
 
         logger.debug("Pressing '%s' x%d", key, presses)
-        _input_backend.press(key, presses=presses, interval=interval)
+        if sys.platform == "win32":
+            self._send_presses(key, presses, interval)
+        else:
+            _input_backend.press(key, presses=presses, interval=interval)
+
+    def _send_presses(self, key: str, presses: int, interval: float) -> None:
+        """Press a key through SendInput using cached scan-code events."""
+        key = key.lower() if len(key) > 1 else key
+        if key not in self._key_inputs:
+            self._key_inputs[key] = _build_key_inputs(key)
+        events = self._key_inputs[key]
+        if events is None:
+            _input_backend.press(key, presses=presses, interval=interval)
+            return
+
+        down, up = events
+        size = ctypes.sizeof(down)
+        send_input = ctypes.windll.user32.SendInput
+        for _ in range(presses):
+            # Keep the mouse-in-corner abort that pydirectinput.press applies
+            _input_backend.failSafeCheck()
+            send_input(1, ctypes.byref(down), size)
+            # Not interruptible, so the key is always released
+            time.sleep(KEY_HOLD_SECONDS)
+            send_input(1, ctypes.byref(up), size)
+            # Nor is the gap: a press sequence such as the double backspace
+            # out of the mission board must not stop halfway
+            time.sleep(interval)
 
     def press_with_delay(
         self,
@@ -113,3 +151,21 @@ class InputService:
     def escape(self) -> None:
         """Press escape key."""
         self.press("esc")
+
+
+def _build_key_inputs(key: str) -> tuple[object, object] | None:
+    """Build the key-down and key-up INPUT events for a key, if it has a scan code."""
+    code = _input_backend.KEYBOARD_MAPPING.get(key)
+    if code is None or key in _EXTENDED_KEYS:
+        return None
+
+    def event(flags: int) -> object:
+        keyboard = _input_backend.KeyBdInput(
+            0, code, flags, 0, ctypes.pointer(ctypes.c_ulong(0))
+        )
+        return _input_backend.Input(
+            ctypes.c_ulong(1), _input_backend.Input_I(ki=keyboard)
+        )
+
+    scancode = _input_backend.KEYEVENTF_SCANCODE
+    return event(scancode), event(scancode | _input_backend.KEYEVENTF_KEYUP)
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import re
+import shutil
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from string import ascii_uppercase
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
+import cv2
 import numpy as np
 import pytesseract
-from PIL import Image, ImageOps
+from PIL import Image
 
 if TYPE_CHECKING:
     from ed_auto_mission.services.screen import ScreenService
@@ -18,30 +25,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Common Tesseract installation paths
-TESSERACT_SEARCH_PATHS = [
+# Everything Tesseract returns around the digits of a count
+_NON_DIGITS = re.compile(r"\D+")
+
+# Common Tesseract installation paths, checked when it isn't on PATH
+TESSERACT_SEARCH_PATHS: tuple[str, ...] = (
     # Windows default
-    Path("C:/Program Files/Tesseract-OCR/tesseract.exe"),
+    "C:/Program Files/Tesseract-OCR/tesseract.exe",
     # Linux common paths
-    Path("/usr/bin/tesseract"),
-    Path("/usr/local/bin/tesseract"),
+    "/usr/bin/tesseract",
+    "/usr/local/bin/tesseract",
     # macOS Homebrew
-    Path("/opt/homebrew/bin/tesseract"),
-    Path("/usr/local/opt/tesseract/bin/tesseract"),
-]
+    "/opt/homebrew/bin/tesseract",
+    "/usr/local/opt/tesseract/bin/tesseract",
+    # Windows drive letter variations
+    *(f"{letter}:/Tesseract-OCR/tesseract.exe" for letter in ascii_uppercase),
+)
+
 
-# Add Windows drive letter variations
-for letter in ascii_uppercase:
-    TESSERACT_SEARCH_PATHS.append(Path(f"{letter}:/Tesseract-OCR/tesseract.exe"))
+@lru_cache(maxsize=None)
+def _load_tesserocr():
+    """Import the optional in-process libtesseract binding, or return None.
+
+    Deferred until the first read, since importing it loads
+    libtesseract and most imports of this module never need it.
+    """
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+    return tesserocr
 
 
 def find_tesseract() -> Path | None:
-    """Search for tesseract executable in common locations."""
-    for path in TESSERACT_SEARCH_PATHS:
-        if path.is_file():
-            logger.debug("Found tesseract at: %s", path)
-            return path
-    return None
+    """Search PATH, then common locations, for the tesseract executable."""
+    on_path = shutil.which("tesseract")
+    if on_path:
+        logger.debug("Found tesseract on PATH: %s", on_path)
+        return Path(on_path)
+
+    found = next((p for p in TESSERACT_SEARCH_PATHS if os.path.isfile(p)), None)
+    if found is None:
+        return None
+    logger.debug("Found tesseract at: %s", found)
+    return Path(found)
 
 
 def setup_tesseract(path: str | Path | None = None) -> None:
@@ -82,11 +109,35 @@ class OCRService:
     # OCR configuration presets
     CONFIG_DIGITS_ONLY = "--psm 7 -c tessedit_char_whitelist=0123456789"
     CONFIG_DIGITS_BLOCK = "--psm 6 -c tessedit_char_whitelist=0123456789"
+    CONFIG_DIGITS_WORD = "--psm 8 -c tessedit_char_whitelist=0123456789"
+    CONFIG_COLUMN = "--psm 4"
     CONFIG_DEFAULT = ""
 
+    # Page segmentation mode and character whitelist of each preset, for
+    # tesserocr; other config strings always go through pytesseract
+    _TESSEROCR_PRESETS: dict[str, tuple[int, str | None]] = {
+        CONFIG_DEFAULT: (3, None),
+        CONFIG_COLUMN: (4, None),
+        CONFIG_DIGITS_ONLY: (7, "0123456789"),
+        CONFIG_DIGITS_BLOCK: (6, "0123456789"),
+        CONFIG_DIGITS_WORD: (8, "0123456789"),
+    }
+
+    # Black rows inserted between stacked regions in batch OCR
+    BATCH_SEPARATOR_HEIGHT = 20
+
+    # Number of recognised images remembered by pixel hash
+    TEXT_CACHE_SIZE = 512
+
+    # Captures whose pixel standard deviation is below this are treated as
+    # empty background and not sent to Tesseract
+    BLANK_STDDEV = 4.0
+
     def __init__(self, screen_service: ScreenService, debug_output: bool = False):
         self._screen = screen_service
         self._debug_output = debug_output
+        self._text_cache: OrderedDict[bytes, str | list[str]] = OrderedDict()
+        self._tess_apis: dict[str, object | None] = {}
 
     def read_text(
         self,
@@ -97,6 +148,9 @@ class OCRService:
         """
         Perform OCR on a screen region.
 
+        Results are cached by the captured pixels, so a region that hasn't
+        changed since an earlier call skips Tesseract.
+
         Args:
             region: Screen region to capture and read
             config: Tesseract configuration string
@@ -105,12 +159,119 @@ class OCRService:
         Returns:
             Extracted text from the region
         """
-        filename = debug_filename if self._debug_output else None
-        image = self._screen.capture_region(region, filename)
-        text = pytesseract.image_to_string(image, config=config)
-        logger.debug("OCR result: %s", text.strip())
+        image = self._screen.capture_region_ndarray(region)
+        if self._debug_output and debug_filename:
+            self._screen.save_debug_image(image, debug_filename)
+
+        if self._is_blank(image):
+            logger.debug("OCR skipped: region is blank")
+            return ""
+
+        key = self._cache_key(image, config)
+        text = self._text_cache.get(key)
+        if text is not None:
+            self._text_cache.move_to_end(key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("OCR result (cached): %s", text.strip())
+            return text
+
+        text = self._image_to_string(image, config)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OCR result: %s", text.strip())
+        self._remember(key, text)
         return text
 
+    def read_text_batch(
+        self,
+        regions: Sequence[ScreenRegion | tuple[int, int, int, int]],
+        config: str = "",
+        debug_filename: str | None = None,
+    ) -> list[str]:
+        """
+        Perform OCR on several screen regions with a single Tesseract call.
+
+        The captured regions are stacked vertically with a black separator
+        between them, and recognised words are assigned back to the region
+        their vertical centre falls in.
+
+        Args:
+            regions: Screen regions to capture and read
+            config: Tesseract configuration string
+            debug_filename: If provided, save the stacked image
+
+        Returns:
+            Extracted text for each region, in the same order
+        """
+        crops = [self._screen.capture_region_ndarray(region) for region in regions]
+        if not crops:
+            return []
+        if all(self._is_blank(crop) for crop in crops):
+            logger.debug("OCR batch skipped: all regions are blank")
+            return ["" for _ in crops]
+
+        width = max(crop.shape[1] for crop in crops)
+        separator = np.zeros((self.BATCH_SEPARATOR_HEIGHT, width, 3), dtype=np.uint8)
+
+        parts: list[np.ndarray] = []
+        row_starts: list[int] = []
+        top = 0
+        for crop in crops:
+            if parts:
+                parts.append(separator)
+                top += self.BATCH_SEPARATOR_HEIGHT
+            if crop.shape[1] < width:
+                crop = np.pad(crop, ((0, 0), (0, width - crop.shape[1]), (0, 0)))
+            row_starts.append(top)
+            parts.append(crop)
+            top += crop.shape[0]
+
+        strip = np.vstack(parts)
+        if self._debug_output and debug_filename:
+            self._screen.save_debug_image(strip, debug_filename)
+
+        key = self._cache_key(strip, config)
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return list(cached)
+
+        data = pytesseract.image_to_data(
+            strip, config=config, output_type=pytesseract.Output.DICT
+        )
+
+        # region index -> Tesseract line -> words
+        lines: list[dict[tuple[int, int, int], list[str]]] = [{} for _ in crops]
+        for i, word in enumerate(data["text"]):
+            if not word.strip():
+                continue
+            centre = data["top"][i] + data["height"][i] // 2
+            row = max(bisect_right(row_starts, centre) - 1, 0)
+            line_key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            lines[row].setdefault(line_key, []).append(word)
+
+        texts = ["\n".join(" ".join(words) for words in row.values()) for row in lines]
+        if logger.isEnabledFor(logging.DEBUG):
+            for text in texts:
+                logger.debug("OCR batch result: %s", text)
+        self._remember(key, texts)
+        return list(texts)
+
+    def _is_blank(self, image: np.ndarray) -> bool:
+        _, stddev = cv2.meanStdDev(image)
+        return float(stddev.max()) < self.BLANK_STDDEV
+
+    @staticmethod
+    def _cache_key(image: np.ndarray, config: str) -> bytes:
+        digest = hashlib.blake2b(np.ascontiguousarray(image), digest_size=16)
+        digest.update(repr(image.shape).encode())
+        digest.update(config.encode())
+        return digest.digest()
+
+    def _remember(self, key: bytes, value: str | list[str]) -> None:
+        self._text_cache[key] = value
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+
     def read_digits(
         self,
         region: ScreenRegion | tuple[int, int, int, int],
@@ -126,26 +287,46 @@ class OCRService:
         Returns:
             Extracted integer value, or None if no digits found
         """
-        filename = debug_filename if self._debug_output else None
-        image = self._screen.capture_region(region, filename)
-
-        # Try multiple preprocessing variants
-        gray = ImageOps.grayscale(image)
+        pixels, width, height, stride = self._screen.capture_region_raw(region)
+        bgra = np.frombuffer(pixels, dtype=np.uint8).reshape(height, stride // 4, 4)
+        if self._debug_output and debug_filename:
+            self._screen.save_debug_image(
+                cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB), debug_filename
+            )
+
+        # Fast path: Otsu-binarised image read as a single word, which skips
+        # Tesseract's page layout analysis
+        gray_arr = cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY)
+        _, binary = cv2.threshold(gray_arr, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        candidate = self._image_to_string(binary, self.CONFIG_DIGITS_WORD)
+        if debug:
+            logger.debug("OCR candidate (otsu): %s", candidate.strip())
+        digits = _NON_DIGITS.sub("", candidate)
+        if digits:
+            return int(digits)
+
+        # Fall back to multiple preprocessing variants, all derived from the
+        # grayscale array above. The contrast-stretched threshold reads UI
+        # digits best, so it goes first.
+        stretched = cv2.normalize(gray_arr, None, 0, 255, cv2.NORM_MINMAX)
         variants = [
-            gray,
-            ImageOps.autocontrast(gray),
-            ImageOps.invert(gray),
-            ImageOps.autocontrast(gray).point(lambda p: 255 if p > 140 else 0),
+            np.where(stretched > 140, 255, 0).astype(np.uint8),
+            255 - gray_arr,
+            gray_arr,
         ]
 
+        # Single-line mode suits the count field, so try it on every variant
+        # before the block mode
         configs = [self.CONFIG_DIGITS_ONLY, self.CONFIG_DIGITS_BLOCK]
 
-        for img in variants:
-            for cfg in configs:
-                candidate = pytesseract.image_to_string(img, config=cfg)
-                logger.debug("OCR candidate (%s): %s", cfg, candidate.strip())
+        for cfg in configs:
+            for img in variants:
+                candidate = self._image_to_string(img, cfg)
+                if debug:
+                    logger.debug("OCR candidate (%s): %s", cfg, candidate.strip())
 
-                digits = "".join(ch for ch in candidate if ch.isdigit())
+                digits = _NON_DIGITS.sub("", candidate)
                 if digits:
                     try:
                         return int(digits)
@@ -155,6 +336,43 @@ class OCRService:
         logger.debug("No digits found in OCR region")
         return None
 
+    def _image_to_string(self, image: np.ndarray, config: str) -> str:
+        api = self._tess_api(config)
+        if api is None:
+            return pytesseract.image_to_string(image, config=config)
+        # Arrays go over as raw bytes, without a PIL image
+        height, width = image.shape[:2]
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        data = np.ascontiguousarray(image).tobytes()
+        api.SetImageBytes(data, width, height, channels, width * channels)
+        return api.GetUTF8Text()
+
+    def _tess_api(self, config: str) -> object | None:
+        """Persistent tesserocr instance for a config preset, if available."""
+        if config in self._tess_apis:
+            return self._tess_apis[config]
+        preset = self._TESSEROCR_PRESETS.get(config)
+        tesserocr = _load_tesserocr() if preset is not None else None
+        if tesserocr is None:
+            self._tess_apis[config] = None
+            return None
+
+        psm, whitelist = preset
+        kwargs = {}
+        # A Windows Tesseract install keeps its tessdata next to the binary
+        tessdata = Path(pytesseract.pytesseract.tesseract_cmd).parent / "tessdata"
+        if tessdata.is_dir():
+            kwargs["path"] = f"{tessdata}/"
+        if whitelist:
+            kwargs["variables"] = {"tessedit_char_whitelist": whitelist}
+        try:
+            api = tesserocr.PyTessBaseAPI(psm=psm, **kwargs)
+        except RuntimeError as exc:
+            logger.debug("tesserocr unavailable, using pytesseract: %s", exc)
+            api = None
+        self._tess_apis[config] = api
+        return api
+
     def compare_images(
         self,
         image1: Image.Image,
@@ -163,7 +381,9 @@ class OCRService:
         """
         Calculate Mean Squared Error between two images.
 
-        Lower values indicate more similar images.
+        Channel errors are summed per pixel and averaged over the pixels, the
+        same as the screen comparisons in the game adapter. Lower values
+        indicate more similar images.
 
         Args:
             image1: First image
@@ -172,14 +392,15 @@ class OCRService:
         Returns:
             MSE value (0 = identical)
         """
-        arr1 = np.array(image1).astype("float")
-        arr2 = np.array(image2).astype("float")
+        arr1 = np.asarray(image1)
+        arr2 = np.asarray(image2)
 
         if arr1.shape != arr2.shape:
             # Resize arr2 to match arr1
 
             image2_resized = image2.resize((arr1.shape[1], arr1.shape[0]))
-            arr2 = np.array(image2_resized).astype("float")
+            arr2 = np.asarray(image2_resized)
 
-        mse = np.sum((arr1 - arr2) ** 2) / float(arr1.shape[0] * arr1.shape[1])
-        return mse
+        # One pass over the uint8 buffers, without float or squared temporaries
+        sse = cv2.norm(arr1, arr2, cv2.NORM_L2SQR)
+        return sse / (arr1.shape[0] * arr1.shape[1])
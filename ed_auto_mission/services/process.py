@@ -8,16 +8,20 @@ from psutil import process_iter
 
 logger = logging.getLogger(__name__)
 
-# Process name patterns for Elite Dangerous
-ED_PROCESS_NAMES = {
-    "elitedangerous",
-    "elitedangerous64",
-}
-
-ED_LAUNCHER_NAMES = {
-    "edlaunch",
-    "edmclient",
-}
+# Process names for Elite Dangerous, lowercase and without ".exe"
+ED_PROCESS_NAMES = frozenset(
+    {
+        "elitedangerous",
+        "elitedangerous64",
+    }
+)
+
+ED_LAUNCHER_NAMES = frozenset(
+    {
+        "edlaunch",
+        "edmclient",
+    }
+)
 
 
 def is_game_running() -> bool:
@@ -27,17 +31,20 @@ def is_game_running() -> bool:
     Returns:
         True if the game process is detected
     """
-    for process in process_iter():
-        try:
-            name = process.name().lower()
-            if any(ed_name in name for ed_name in ED_PROCESS_NAMES):
-                logger.debug("Found game process: %s", process.name())
-                return True
-            if any(launcher in name for launcher in ED_LAUNCHER_NAMES):
-                logger.debug("Found launcher process: %s", process.name())
-        except (PermissionError, OSError):
-            # Process access denied or process terminated
+    # Asking for just the name lets psutil fill it in while enumerating and
+    # skips processes it can't access, instead of a name() call per process.
+    for process in process_iter(["name"]):
+        raw_name = process.info["name"]
+        if not raw_name:
             continue
+        name = raw_name.lower()
+        if name.endswith(".exe"):
+            name = name[:-4]
+        if name in ED_PROCESS_NAMES:
+            logger.debug("Found game process: %s", raw_name)
+            return True
+        if name in ED_LAUNCHER_NAMES:
+            logger.debug("Found launcher process: %s", raw_name)
 
     return False
 
@@ -3,29 +3,53 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-import pyautogui
+import mss
+import numpy as np
+from PIL import Image
 
 from ed_auto_mission.core.types import ScreenContext, ScreenRegion
 
-if TYPE_CHECKING:
-    from PIL import Image
-
 logger = logging.getLogger(__name__)
 
 
+# Screen size from the last query; the resolution is fixed for a run
+_SIZE: tuple[int, int] | None = None
+
+
+def refresh_size() -> tuple[int, int]:
+    """Query the screen size again and update the cached value."""
+    global _SIZE
+    # Imported here so screen capture alone doesn't load pyautogui
+    import pyautogui
+
+    width, height = pyautogui.size()
+    _SIZE = (width, height)
+    return _SIZE
+
+
 def get_screen_context() -> ScreenContext:
     """Get the current screen dimensions as a ScreenContext."""
-    width, height = pyautogui.size()
+    width, height = _SIZE or refresh_size()
     return ScreenContext(width=width, height=height)
 
 
+def _write_debug_image(image: Image.Image, filename: str) -> None:
+    try:
+        image.save(filename)
+    except OSError as exc:
+        logger.warning("Failed to save debug image %s: %s", filename, exc)
+
+
 class ScreenService:
     """Service for screen capture and region management."""
 
     def __init__(self, context: ScreenContext | None = None):
         self._context = context or get_screen_context()
+        self._local = threading.local()
+        self._debug_writer: ThreadPoolExecutor | None = None
 
     @property
     def context(self) -> ScreenContext:
@@ -44,6 +68,7 @@ class ScreenService:
 
     def refresh(self) -> None:
         """Refresh screen dimensions (useful if resolution changed)."""
+        refresh_size()
         self._context = get_screen_context()
 
     def capture_region(
@@ -61,16 +86,97 @@ class ScreenService:
         Returns:
             PIL Image of the captured region
         """
-        if isinstance(region, ScreenRegion):
-            scaled = region.scaled(self.width, self.height)
+        image = Image.fromarray(self.capture_region_ndarray(region))
+        if filename:
+            self.save_debug_image(image, filename)
+        return image
+
+    def capture_region_ndarray(
+        self,
+        region: ScreenRegion | tuple[int, int, int, int],
+    ) -> np.ndarray:
+        """
+        Capture a screen region straight into an RGB uint8 array.
+
+        Skips the PIL image round-trip, for callers that only compare pixels.
+
+        Args:
+            region: ScreenRegion or (x, y, width, height) tuple
+
+        Returns:
+            Array of shape (height, width, 3)
+        """
+        x, y, width, height = self._resolve_region(region)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Capturing region: %s", (x, y, width, height))
+
+        shot = self._grabber().grab(
+            {"left": x, "top": y, "width": width, "height": height}
+        )
+        return np.frombuffer(shot.rgb, dtype=np.uint8).reshape(
+            shot.height, shot.width, 3
+        )
+
+    def capture_region_raw(
+        self,
+        region: ScreenRegion | tuple[int, int, int, int],
+    ) -> tuple[bytearray, int, int, int]:
+        """
+        Capture a screen region as the raw BGRA buffer mss grabbed, uncopied.
+
+        Args:
+            region: ScreenRegion or (x, y, width, height) tuple
+
+        Returns:
+            (pixels, width, height, bytes per row)
+        """
+        x, y, width, height = self._resolve_region(region)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Capturing region: %s", (x, y, width, height))
+
+        shot = self._grabber().grab(
+            {"left": x, "top": y, "width": width, "height": height}
+        )
+        return shot.raw, shot.width, shot.height, shot.width * 4
+
+    def save_debug_image(self, image: Image.Image | np.ndarray, filename: str) -> None:
+        """
+        Write a debug image in the background.
+
+        PNG encoding runs on a single writer thread so it never holds up
+        detection; saves are written in the order they were requested.
+
+        Args:
+            image: PIL Image or RGB uint8 array to save
+            filename: Destination path
+        """
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image.copy())
         else:
-            scaled = region
+            image = image.copy()
 
-        logger.debug("Capturing region: %s", scaled)
+        if self._debug_writer is None:
+            self._debug_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="debug-io"
+            )
+        self._debug_writer.submit(_write_debug_image, image, filename)
 
-        if filename:
-            return pyautogui.screenshot(region=scaled, imageFilename=filename)
-        return pyautogui.screenshot(region=scaled)
+    def _resolve_region(
+        self, region: ScreenRegion | tuple[int, int, int, int]
+    ) -> tuple[int, int, int, int]:
+        if isinstance(region, ScreenRegion):
+            return region.scaled(self.width, self.height)
+        return region
+
+    def _grabber(self) -> mss.base.MSSBase:
+        # mss handles are bound to the thread that created them
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+        return sct
 
     def scale_x(self, value: int) -> int:
         """Scale an x-coordinate from reference to current resolution."""
@@ -5,31 +5,45 @@ from __future__ import annotations
 import random
 import threading
 from time import sleep as _sleep
-from typing import Callable
 
-_stop_check: Callable[[], bool] | None = None
-_stop_check_lock = threading.Lock()
+# Bound once; these helpers run on nearly every key press
+_rand = random.random
 
+_stop_event: threading.Event | None = None
+_stop_event_lock = threading.Lock()
 
-def set_stop_check(check_fn: Callable[[], bool] | None) -> None:
-    global _stop_check
-    with _stop_check_lock:
-        _stop_check = check_fn
 
-
-def clear_stop_check() -> None:
-    set_stop_check(None)
+def set_stop_event(event: threading.Event | None) -> None:
+    """Make sleep() return early, raising InterruptedError, once event is set."""
+    global _stop_event
+    with _stop_event_lock:
+        _stop_event = event
 
 
 def is_stop_requested() -> bool:
-    with _stop_check_lock:
-        if _stop_check is not None:
-            return _stop_check()
-    return False
+    event = _stop_event
+    return event is not None and event.is_set()
 
 
 def slight_random_time(base: float) -> float:
-    return random.random() + base
+    return _rand() + base
+
+
+class JitterPool:
+    """Pre-sampled jitter for long key sequences, avoiding an RNG call per press."""
+
+    def __init__(self, size: int = 1024):
+        self._buf = [_rand() for _ in range(size)]
+        self._idx = 0
+
+    def next(self, base: float) -> float:
+        """Same distribution as slight_random_time(base), drawn from the pool."""
+        value = self._buf[self._idx] + base
+        self._idx = (self._idx + 1) % len(self._buf)
+        return value
+
+
+jitter_pool = JitterPool()
 
 
 def random_delay(
@@ -43,18 +57,18 @@ def sleep_with_jitter(
     base_seconds: float,
     jitter: float = 1.0,
 ) -> None:
-    sleep(base_seconds + random.random() * jitter)
+    sleep(base_seconds + _rand() * jitter)
 
 
 def sleep(seconds: float) -> None:
     """
-    Sleep for the specified duration, checking for stop every 0.1 seconds.
+    Sleep for the specified duration, waking as soon as a stop is requested.
     Raises InterruptedError if stop is requested.
     """
-    remaining = seconds
-    while remaining > 0:
-        if is_stop_requested():
-            raise InterruptedError("Stop requested")
-        chunk = min(0.1, remaining)
-        _sleep(chunk)
-        remaining -= chunk
+    if seconds <= 0:
+        return
+    event = _stop_event
+    if event is None:
+        _sleep(seconds)
+    elif event.wait(seconds):
+        raise InterruptedError("Stop requested")
@@ -19,12 +19,23 @@ class WindowFocusError(Exception):
 if sys.platform == "win32":
     import win32gui
 
-    def _enum_windows_callback(hwnd: int, results: list[tuple[int, str]]) -> bool:
-        """Callback for EnumWindows to collect window handles and titles."""
+    # Last handle found per title pattern; window handles stay valid for the
+    # window's lifetime, so repeat lookups can skip the enumeration
+    _hwnd_cache: dict[str, int] = {}
+
+    def _match_window_callback(
+        hwnd: int, state: tuple[re.Pattern[str], list[int]]
+    ) -> bool:
+        """Callback for EnumWindows; stops at the first visible title match."""
+        regex, found = state
         if win32gui.IsWindowVisible(hwnd):
             title = win32gui.GetWindowText(hwnd)
             if title:
-                results.append((hwnd, title))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Checking window: %s", title)
+                if regex.match(title):
+                    found.append(hwnd)
+                    return False
         return True
 
     def find_window(pattern: str) -> Optional[int]:
@@ -37,15 +48,32 @@ if sys.platform == "win32":
         Returns:
             Window handle if found, None otherwise
         """
-        results: list[tuple[int, str]] = []
-        win32gui.EnumWindows(_enum_windows_callback, results)
-
-        for hwnd, title in results:
-            logger.debug("Checking window: %s", title)
-            if re.match(pattern, title):
-                return hwnd
-
-        return None
+        regex = re.compile(pattern)
+
+        cached = _hwnd_cache.get(pattern)
+        # Handles are reused once a window closes, so check the title too
+        if (
+            cached is not None
+            and win32gui.IsWindow(cached)
+            and win32gui.IsWindowVisible(cached)
+            and regex.match(win32gui.GetWindowText(cached))
+        ):
+            return cached
+
+        found: list[int] = []
+        try:
+            win32gui.EnumWindows(_match_window_callback, (regex, found))
+        except win32gui.error:
+            # Some pywin32 versions report a callback that stopped the
+            # enumeration early as a failure
+            if not found:
+                raise
+
+        if not found:
+            _hwnd_cache.pop(pattern, None)
+            return None
+        _hwnd_cache[pattern] = found[0]
+        return found[0]
 
     def focus_window(pattern: str) -> None:
         """
@@ -0,0 +1,24 @@
+from ed_auto_mission.core.mission_runner import MissionRunner
+
+extract = MissionRunner._extract_credit_value
+
+
+def test_extracts_reward_with_separators():
+    assert extract("MINE GOLD 49,000,000 CR") == 49_000_000
+
+
+def test_ignores_numbers_before_words_starting_with_cr():
+    text = "DELIVER 20 CRATES OF PACKAGES\nREWARD: 5,000,000 CR"
+    assert extract(text) == 5_000_000
+
+
+def test_amount_and_suffix_must_share_a_line():
+    assert extract("TRANSPORT 20\nCR TEAM") is None
+
+
+def test_reward_late_in_text_keeps_full_amount():
+    assert extract("A" * 60 + "1,234,567 CR " + "Z" * 28) == 1_234_567
+
+
+def test_no_reward():
+    assert extract("MINE GOLD") is None